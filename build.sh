@@ -0,0 +1,27 @@
+#!/bin/bash
+
+# TMH 네이티브 바이너리 빌드 스크립트
+# 인터프리터 시작 + import 비용을 없애기 위해 tmh.py를 AOT 컴파일합니다.
+# Usage: ./build.sh
+
+set -e
+
+echo "🔨 TMH 네이티브 바이너리 빌드를 시작합니다..."
+
+if ! python3 -c "import nuitka" &> /dev/null; then
+    echo "❌ Nuitka가 설치되지 않았습니다."
+    echo "   설치: pip install nuitka"
+    exit 1
+fi
+
+python3 -m nuitka \
+    --onefile \
+    --lto=yes \
+    --python-flag=no_site \
+    --output-filename=tmh \
+    tmh.py
+
+echo ""
+echo "✅ 빌드 완료: ./tmh"
+echo "💡 PATH에 추가하거나 프로젝트 루트로 복사해서 사용하세요."
+echo "   (tmh.py는 그대로 유지됩니다 - 수정 후 다시 빌드하면 됩니다)"
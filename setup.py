@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+setup.py - Optional build for the tmh_core Cython extension
+
+tmh.py works without it; compiling just speeds up the task-graph loops:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name='tmh-core',
+    ext_modules=cythonize(
+        [Extension('tmh_core', ['tmh_core.pyx'])],
+        language_level=3,
+    ),
+)
@@ -4,14 +4,165 @@ tmh.py - Task Master Helper (Python version)
 완전히 tmh.sh와 동일한 동작을 수행하는 Python 구현
 """
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
 import json
 import os
 import re
+import shutil
+import socket
 import subprocess
 import sys
+import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import tmh_core  # compiled from tmh_core.pyx via setup.py
+except ImportError:
+    tmh_core = None
+
+# Below this size stdlib json wins; SIMD parsers only pay off on bigger files
+_ORJSON_MIN_BYTES = 4096
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson for large payloads when available"""
+    if orjson is not None and len(data) >= _ORJSON_MIN_BYTES:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _read_json_file(path: str) -> Any:
+    """Read and parse a small JSON file via raw fd I/O (skips the TextIOWrapper stack)"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    return _json_loads(data)
+
+
+def _task_summary(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields the ready/blocked logic needs"""
+    return {
+        'id': task.get('id'),
+        'status': task.get('status'),
+        'dependencies': task.get('dependencies', []),
+    }
+
+
+# Compiled once at import: slugify runs per task in every worktree loop
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+_NL_TABLE = str.maketrans({'\r': ' ', '\n': ' '})
+
+# Shared prompt template, formatted once per task via str.format_map
+_PROMPT_TEMPLATE = """You are an implementation agent for Task #{id}
+Title: {title}
+Status: {status}  Priority: {priority}
+Dependencies: {deps}
+Description:
+{description}
+
+Implementation Details:
+{details}
+
+Test Strategy:
+{test}
+
+Deliverables:
+- [ ] Code commits / PRs
+- [ ] README/Notes
+- [ ] Tests per strategy
+
+Instructions:
+1. Work contract-first. Do not change external contracts unless stated.
+2. If blocked by deps, stub/mocks allowed—note the assumptions.
+3. Output incremental patches or code blocks.
+4. Ask for missing info explicitly.
+5. Keep messages short; show only the diff/command snippets.
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _which(command: str) -> bool:
+    """Check PATH for a command without forking (memoized)"""
+    return shutil.which(command) is not None
+
+
+# Non-interactive query commands that a daemon can answer without touching
+# the caller's terminal or forking external tools
+_DAEMON_SAFE_COMMANDS = frozenset({'ready-ids', 'blocked', 'prompt', 'debug-ready'})
+
+
+def _daemon_socket_path() -> str:
+    """Socket path for the tmh daemon, scoped to the current project.
+
+    The daemon answers from its own project's .taskmaster tree, so the
+    socket name embeds a hash of the working directory - a client in a
+    different project computes a different path, finds no socket, and
+    falls back in-process instead of getting another project's tasks.
+    """
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    digest = hashlib.sha1(os.path.realpath(os.getcwd()).encode('utf-8')).hexdigest()[:12]
+    return os.path.join(runtime_dir, f'tmh-{digest}.sock')
+
+
+def _try_daemon(args: List[str]) -> bool:
+    """Run the command via a live tmh daemon, if one is listening.
+
+    Amortizes interpreter startup + import cost for the hot query
+    commands; returns False (caller runs in-process) when no daemon is
+    up or the command needs the local terminal.
+    """
+    if not args or args[0] not in _DAEMON_SAFE_COMMANDS:
+        return False
+
+    sock_path = _daemon_socket_path()
+    if not os.path.exists(sock_path):
+        return False
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(sock_path)
+            client.sendall((json.dumps(args) + '\n').encode('utf-8'))
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+    except OSError:
+        return False
+
+    try:
+        reply = json.loads(b''.join(chunks))
+    except ValueError:
+        return False
+
+    sys.stdout.write(reply.get('output', ''))
+    status = reply.get('status', 0)
+    if status:
+        sys.exit(status)
+    return True
 
 
 class TMH:
@@ -33,6 +184,43 @@ class TMH:
         self.branch_prefix = os.environ.get('BRANCH_PREFIX', 'ws/')
         self.project_root = os.getcwd()  # Current working directory as project root
 
+        # Memoized tasks.json state, keyed by file mtime (see _load_tasks)
+        self._tasks_cache: Optional[Dict[str, Any]] = None
+        self._tasks_cache_mtime: Optional[int] = None
+        self._all_tasks_cache: Optional[List[Dict[str, Any]]] = None
+        self._status_map_cache: Optional[Dict[str, str]] = None
+        self._task_index_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._summaries_cache: Optional[List[Dict[str, Any]]] = None
+        self._summaries_mtime: Optional[int] = None
+        self._packed_refs_cache: Optional[set] = None
+        self._dirs_ready: set = set()
+
+        # Command table for main(): one dict lookup instead of an if/elif chain
+        self._commands = {
+            'ready-ids': self._cmd_ready_ids,
+            'blocked': self._cmd_blocked,
+            'start-ready': self._cmd_start_ready,
+            'prompt': self._cmd_prompt,
+            'prompt-all-ready': self._cmd_prompt_all_ready,
+            'worktree-ready': self._cmd_worktree_ready,
+            'kickoff-ready': self._cmd_kickoff_ready,
+            'kickoff-ready-claude': self._cmd_kickoff_ready_claude,
+            'worktree-ready-claude': self._cmd_worktree_ready_claude,
+            'debug-ready': self._cmd_debug_ready,
+            'verify-kickoff': self._cmd_verify_kickoff,
+            'set': self._cmd_set,
+            'show': self._cmd_show,
+            'next': self._cmd_next,
+            'claude-prompt': self._cmd_claude_prompt,
+            'claude-ready': self._cmd_claude_ready,
+            'generate-scripts': self._cmd_generate_scripts,
+            'generate-review': self._cmd_generate_review,
+            'auto-review': self._cmd_auto_review,
+            'help': self._cmd_help,
+            '-h': self._cmd_help,
+            '--help': self._cmd_help,
+        }
+
     def _get_current_tag(self) -> str:
         """Get current active tag from Task Master state or environment"""
         # 1. Check environment variable first
@@ -43,28 +231,26 @@ class TMH:
         try:
             state_file = '.taskmaster/state.json'
             if os.path.exists(state_file):
-                with open(state_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-                    if 'currentTag' in state:
-                        return state['currentTag']
+                state = _read_json_file(state_file)
+                if 'currentTag' in state:
+                    return state['currentTag']
         except Exception:
             pass
-        
+
         # 3. Try to detect from tasks.json structure
         try:
             if os.path.exists('.taskmaster/tasks/tasks.json'):
-                with open('.taskmaster/tasks/tasks.json', 'r', encoding='utf-8') as f:
-                    tasks_data = json.load(f)
-                    # If it has a 'tags' object, use the first available tag
-                    if 'tags' in tasks_data:
-                        available_tags = list(tasks_data['tags'].keys())
-                        if available_tags:
-                            return available_tags[0]
-                    # Otherwise, look for direct tag keys (excluding 'metadata')
-                    else:
-                        for key in tasks_data.keys():
-                            if key != 'metadata' and isinstance(tasks_data[key], dict) and 'tasks' in tasks_data[key]:
-                                return key
+                tasks_data = _read_json_file('.taskmaster/tasks/tasks.json')
+                # If it has a 'tags' object, use the first available tag
+                if 'tags' in tasks_data:
+                    available_tags = list(tasks_data['tags'].keys())
+                    if available_tags:
+                        return available_tags[0]
+                # Otherwise, look for direct tag keys (excluding 'metadata')
+                else:
+                    for key in tasks_data.keys():
+                        if key != 'metadata' and isinstance(tasks_data[key], dict) and 'tasks' in tasks_data[key]:
+                            return key
         except Exception:
             pass
         
@@ -73,180 +259,299 @@ class TMH:
 
     def _command_exists(self, command: str) -> bool:
         """Check if a command exists in PATH"""
-        try:
-            subprocess.run(['which', command], capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        return _which(command)
+
+    def _invalidate_tasks_cache(self) -> None:
+        """Drop the memoized tasks.json state (call after any set-status)"""
+        self._tasks_cache = None
+        self._tasks_cache_mtime = None
+        self._all_tasks_cache = None
+        self._status_map_cache = None
+        self._task_index_cache = None
+        self._summaries_cache = None
+        self._summaries_mtime = None
 
     def _load_tasks(self) -> Dict[str, Any]:
-        """Load tasks from JSON file"""
+        """Load tasks from JSON file (memoized per file mtime)"""
         try:
-            with open(self.tm_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            mtime = os.stat(self.tm_file).st_mtime_ns
         except FileNotFoundError:
             print(f"Tasks file not found: {self.tm_file}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+
+        if self._tasks_cache is not None and self._tasks_cache_mtime == mtime:
+            return self._tasks_cache
+
+        try:
+            with open(self.tm_file, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            print(f"Tasks file not found: {self.tm_file}")
+            sys.exit(1)
+        except ValueError as e:
+            # Covers json.JSONDecodeError and orjson.JSONDecodeError
             print(f"Invalid JSON in tasks file: {e}")
             sys.exit(1)
 
+        self._tasks_cache = data
+        self._tasks_cache_mtime = mtime
+        self._all_tasks_cache = None
+        self._status_map_cache = None
+        self._task_index_cache = None
+        return data
+
     def _get_all_tasks(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Get all tasks including subtasks (equivalent to jq allTasks function)"""
+        if data is self._tasks_cache and self._all_tasks_cache is not None:
+            return self._all_tasks_cache
+
         tag_data = data.get(self.tag, {})
         parent_tasks = tag_data.get('tasks', [])
-        
+
         all_tasks = []
+        # Bind the methods once; this loop runs per task on every command
+        append = all_tasks.append
+        extend = all_tasks.extend
         for task in parent_tasks:
-            all_tasks.append(task)
-            subtasks = task.get('subtasks', [])
-            all_tasks.extend(subtasks)
-        
+            append(task)
+            subtasks = task.get('subtasks')
+            if subtasks:
+                extend(subtasks)
+
+        if data is self._tasks_cache:
+            self._all_tasks_cache = all_tasks
         return all_tasks
 
     def _get_status_map(self, all_tasks: List[Dict[str, Any]]) -> Dict[str, str]:
         """Create a mapping of task ID to status"""
-        return {str(task['id']): task['status'] for task in all_tasks}
+        if all_tasks is self._all_tasks_cache and self._status_map_cache is not None:
+            return self._status_map_cache
+
+        if tmh_core is not None:
+            status_map = tmh_core._status_map(all_tasks)
+        else:
+            status_map = {str(task['id']): task['status'] for task in all_tasks}
+
+        if all_tasks is self._all_tasks_cache:
+            self._status_map_cache = status_map
+        return status_map
+
+    def _get_task_summaries(self) -> List[Dict[str, Any]]:
+        """Get slim {id, status, dependencies} dicts for every task and subtask.
+
+        Streams tasks.json with ijson when available so large text fields
+        (description, details, testStrategy) never become Python objects;
+        otherwise reuses the cached full parse.
+        """
+        if ijson is None or self._tasks_cache is not None:
+            return self._get_all_tasks(self._load_tasks())
+
+        try:
+            mtime = os.stat(self.tm_file).st_mtime_ns
+        except FileNotFoundError:
+            print(f"Tasks file not found: {self.tm_file}")
+            sys.exit(1)
+
+        if self._summaries_cache is not None and self._summaries_mtime == mtime:
+            return self._summaries_cache
+
+        summaries = []
+        try:
+            with open(self.tm_file, 'rb') as f:
+                for task in ijson.items(f, f'{self.tag}.tasks.item'):
+                    summaries.append(_task_summary(task))
+                    for subtask in task.get('subtasks') or []:
+                        summaries.append(_task_summary(subtask))
+        except FileNotFoundError:
+            print(f"Tasks file not found: {self.tm_file}")
+            sys.exit(1)
+        except Exception as e:
+            print(f"Invalid JSON in tasks file: {e}")
+            sys.exit(1)
+
+        self._summaries_cache = summaries
+        self._summaries_mtime = mtime
+        return summaries
+
+    def _build_task_index(self) -> Dict[str, Dict[str, Any]]:
+        """Create an ID -> task mapping for O(1) lookups (cached with the tasks file)"""
+        if self._task_index_cache is not None:
+            return self._task_index_cache
+
+        data = self._load_tasks()
+        index = {str(task['id']): task for task in self._get_all_tasks(data)}
+        self._task_index_cache = index
+        return index
 
     def jq_ready_ids(self) -> List[str]:
         """Get IDs of tasks that are ready (pending with satisfied dependencies)"""
-        data = self._load_tasks()
-        all_tasks = self._get_all_tasks(data)
+        all_tasks = self._get_task_summaries()
         status_map = self._get_status_map(all_tasks)
-        
-        ready_ids = []
-        for task in all_tasks:
-            if task['status'] != 'pending':
-                continue
-            
-            dependencies = task.get('dependencies', [])
-            if not dependencies:
-                ready_ids.append(str(task['id']))
-                continue
-            
-            # Check if all dependencies are done or in-progress
-            deps_satisfied = all(
-                status_map.get(str(dep_id), '') in ['done', 'in-progress']
-                for dep_id in dependencies
-            )
-            
-            if deps_satisfied:
-                ready_ids.append(str(task['id']))
-        
-        return sorted(ready_ids, key=lambda x: float(x))
+
+        if tmh_core is not None:
+            ready_ids = tmh_core._ready_ids_from(all_tasks, status_map)
+        else:
+            ready_ids = []
+            for task in all_tasks:
+                if task['status'] != 'pending':
+                    continue
+
+                dependencies = task.get('dependencies', [])
+                if not dependencies:
+                    ready_ids.append(str(task['id']))
+                    continue
+
+                # Check if all dependencies are done or in-progress
+                deps_satisfied = all(
+                    status_map.get(str(dep_id), '') in ['done', 'in-progress']
+                    for dep_id in dependencies
+                )
+
+                if deps_satisfied:
+                    ready_ids.append(str(task['id']))
+        
+        # Decorate-sort-undecorate: parse "3"/"3.2" IDs once into int tuples
+        # so the sort compares tuples in C instead of calling float() per compare
+        pairs = [(tuple(int(p) for p in task_id.split('.')), task_id) for task_id in ready_ids]
+        pairs.sort()
+        return [task_id for _, task_id in pairs]
 
     def jq_blocked(self) -> List[Tuple[str, str]]:
         """Get blocked tasks with their blocking dependencies"""
-        data = self._load_tasks()
-        all_tasks = self._get_all_tasks(data)
+        all_tasks = self._get_task_summaries()
         status_map = self._get_status_map(all_tasks)
-        
+
+        if tmh_core is not None:
+            return tmh_core._blocked_from(all_tasks, status_map)
+
         blocked = []
         for task in all_tasks:
             if task['status'] != 'pending':
                 continue
-            
+
             dependencies = task.get('dependencies', [])
             if not dependencies:
                 continue
-            
+
             # Check if any dependencies are not done/in-progress
             unsatisfied_deps = [
                 str(dep_id) for dep_id in dependencies
                 if status_map.get(str(dep_id), '') not in ['done', 'in-progress']
             ]
-            
+
             if unsatisfied_deps:
                 blocked.append((str(task['id']), ','.join(unsatisfied_deps)))
-        
+
         return blocked
 
     def get_title(self, task_id: str) -> str:
         """Get task title by ID"""
-        data = self._load_tasks()
-        all_tasks = self._get_all_tasks(data)
-        
-        for task in all_tasks:
-            if str(task['id']) == task_id:
-                return task['title']
-        
-        return ""
+        task = self._build_task_index().get(task_id)
+        return task['title'] if task else ""
 
-    def prompt_one(self, task_id: str) -> str:
+    def prompt_one(self, task_id: str, index: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
         """Generate prompt text for a specific task"""
-        data = self._load_tasks()
-        all_tasks = self._get_all_tasks(data)
-        
-        for task in all_tasks:
-            if str(task['id']) == task_id:
-                dependencies = task.get('dependencies', [])
-                dep_str = ', '.join(map(str, dependencies))
-                
-                prompt = f"""You are an implementation agent for Task #{task['id']}
-Title: {task['title']}
-Status: {task['status']}  Priority: {task.get('priority', 'medium')}
-Dependencies: {dep_str}
-Description:
-{task.get('description', '(none)')}
+        if index is None:
+            index = self._build_task_index()
 
-Implementation Details:
-{task.get('details', '(none)')}
+        task = index.get(task_id)
+        if task is None:
+            return ""
 
-Test Strategy:
-{task.get('testStrategy', '(none)')}
-
-Deliverables:
-- [ ] Code commits / PRs
-- [ ] README/Notes
-- [ ] Tests per strategy
-
-Instructions:
-1. Work contract-first. Do not change external contracts unless stated.
-2. If blocked by deps, stub/mocks allowed—note the assumptions.
-3. Output incremental patches or code blocks.
-4. Ask for missing info explicitly.
-5. Keep messages short; show only the diff/command snippets.
-"""
-                return prompt
-        
-        return ""
+        return _PROMPT_TEMPLATE.format_map({
+            'id': task['id'],
+            'title': task['title'],
+            'status': task['status'],
+            'priority': task.get('priority', 'medium'),
+            'deps': ', '.join(map(str, task.get('dependencies', []))),
+            'description': task.get('description', '(none)'),
+            'details': task.get('details', '(none)'),
+            'test': task.get('testStrategy', '(none)'),
+        })
 
+    @functools.lru_cache(maxsize=None)
     def slugify(self, text: str) -> str:
-        """Convert text to URL-friendly slug"""
-        # Replace newlines and carriage returns with spaces
-        s = text.replace('\r', ' ').replace('\n', ' ')
-        # Convert to lowercase
-        s = s.lower()
-        # Replace non-alphanumeric characters with hyphens
-        s = re.sub(r'[^a-z0-9]+', '-', s)
-        # Remove leading and trailing hyphens
-        s = s.strip('-')
-        
+        """Convert text to URL-friendly slug (memoized per title)"""
+        s = text.translate(_NL_TABLE).lower()
+        s = _SLUG_RE.sub('-', s).strip('-')
         return s if s else 'task'
 
+    def _write_prompt_file(self, prompt_file: Path, prompt_text: str) -> None:
+        """Write a prompt file and advise the kernel it won't be read by us again"""
+        with open(prompt_file, 'wb') as f:
+            f.write(prompt_text.encode('utf-8'))
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    f.flush()
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+
+    def _write_prompts(self, ready_ids: List[str], out_dir: str, label: str = 'Wrote') -> None:
+        """Write prompt files for the given tasks, overlapping the file I/O"""
+        out_path = Path(out_dir)
+        index = self._build_task_index()
+        files = [(out_path / f"{task_id}.txt", self.prompt_one(task_id, index))
+                 for task_id in ready_ids]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+            futures = {executor.submit(self._write_prompt_file, f, text): f
+                       for f, text in files}
+            for future in as_completed(futures):
+                future.result()
+                print(f"{label} {futures[future]}")
+
     def prompt_all_ready(self, out_dir: Optional[str] = None) -> None:
         """Generate prompt files for all ready tasks"""
         if out_dir is None:
             out_dir = self.prompt_dir
-        
-        Path(out_dir).mkdir(parents=True, exist_ok=True)
-        
+
+        self._ensure_dir(out_dir)
+
         ready_ids = self.jq_ready_ids()
         if not ready_ids:
             print("No ready tasks.")
             return
-        
-        for task_id in ready_ids:
-            prompt_text = self.prompt_one(task_id)
-            prompt_file = Path(out_dir) / f"{task_id}.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(prompt_text)
-            print(f"Wrote {prompt_file}")
+
+        self._write_prompts(ready_ids, out_dir)
+
+    def _git_dir(self) -> Optional[Path]:
+        """Find the .git directory by walking up from cwd (None when absent or a worktree link file)"""
+        cwd = Path.cwd().resolve()
+        for parent in [cwd] + list(cwd.parents):
+            git_path = parent / '.git'
+            if git_path.is_dir():
+                return git_path
+            if git_path.exists():
+                # .git file (worktree/submodule) - let git itself resolve it
+                return None
+        return None
+
+    def _packed_refs(self, git_dir: Path) -> set:
+        """Parse .git/packed-refs into a set of full ref names (cached)"""
+        if self._packed_refs_cache is None:
+            refs = set()
+            try:
+                with open(git_dir / 'packed-refs', 'r', encoding='utf-8') as f:
+                    for line in f:
+                        if line.startswith(('#', '^')):
+                            continue
+                        parts = line.split()
+                        if len(parts) == 2:
+                            refs.add(parts[1])
+            except FileNotFoundError:
+                pass
+            self._packed_refs_cache = refs
+        return self._packed_refs_cache
 
     def _is_git_repo(self) -> bool:
         """Check if current directory is a git repository"""
+        cwd = Path.cwd().resolve()
+        for parent in [cwd] + list(cwd.parents):
+            if (parent / '.git').exists():
+                return True
         try:
-            subprocess.run(['git', 'rev-parse', '--is-inside-work-tree'], 
+            subprocess.run(['git', 'rev-parse', '--is-inside-work-tree'],
                           capture_output=True, check=True)
             return True
         except subprocess.CalledProcessError:
@@ -254,8 +559,18 @@ Instructions:
 
     def _has_commits(self) -> bool:
         """Check if git repository has at least one commit"""
+        git_dir = self._git_dir()
+        if git_dir is not None:
+            try:
+                head = (git_dir / 'HEAD').read_text(encoding='utf-8').strip()
+            except FileNotFoundError:
+                return False
+            if head.startswith('ref: '):
+                ref = head[5:]
+                return (git_dir / ref).exists() or ref in self._packed_refs(git_dir)
+            return bool(head)  # detached HEAD points straight at a commit
         try:
-            subprocess.run(['git', 'rev-parse', 'HEAD'], 
+            subprocess.run(['git', 'rev-parse', 'HEAD'],
                           capture_output=True, check=True)
             return True
         except subprocess.CalledProcessError:
@@ -263,83 +578,238 @@ Instructions:
 
     def _branch_exists(self, branch_name: str) -> bool:
         """Check if a git branch exists"""
+        git_dir = self._git_dir()
+        if git_dir is not None:
+            if (git_dir / 'refs' / 'heads' / branch_name).exists():
+                return True
+            return f'refs/heads/{branch_name}' in self._packed_refs(git_dir)
         try:
-            subprocess.run(['git', 'show-ref', '--verify', '--quiet', f'refs/heads/{branch_name}'], 
+            subprocess.run(['git', 'show-ref', '--verify', '--quiet', f'refs/heads/{branch_name}'],
                           capture_output=True, check=True)
             return True
         except subprocess.CalledProcessError:
             return False
 
+    def _wait_for_vscode_window(self, title: str = '', timeout: float = 3.0) -> bool:
+        """Poll for a VS Code window (macOS) instead of sleeping a fixed interval.
+
+        With a title substring, waits for the window showing that folder.
+        The bare existence check is trivially true once any window is
+        open, which let back-to-back opens race into the previous window.
+        """
+        if sys.platform != 'darwin':
+            return False
+        if title:
+            check = ('tell application "System Events" to count '
+                     f'(windows of process "Code" whose name contains "{title}")')
+        else:
+            check = 'tell application "System Events" to exists window 1 of process "Code"'
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                result = subprocess.run(['osascript', '-e', check],
+                                        capture_output=True, text=True, timeout=1)
+                value = result.stdout.strip()
+                if title:
+                    if value.isdigit() and int(value) > 0:
+                        return True
+                elif value == 'true':
+                    return True
+            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+                pass
+            time.sleep(0.1)
+        return False
+
     def _open_vscode_with_terminal(self, path: str) -> None:
         """Open VS Code with terminal automatically"""
-        # First open VS Code
-        subprocess.run(['code', '-n', path])
-        
+        # Fire-and-forget: 'code' forks off and does its work in the background
+        subprocess.Popen(['code', '-n', path])
+
         # Use AppleScript to open terminal (macOS)
         if sys.platform == 'darwin':
-            applescript = '''
+            # Wait for (and then raise) the window for this folder, so the
+            # keystroke can't land in a window from an earlier iteration
+            folder = os.path.basename(os.path.abspath(path))
+            self._wait_for_vscode_window(folder)
+            applescript = f'''
             tell application "Visual Studio Code"
                 activate
-                delay 1
-                tell application "System Events"
-                    keystroke "`" using {command down}
+            end tell
+            tell application "System Events"
+                tell process "Code"
+                    perform action "AXRaise" of (first window whose name contains "{folder}")
+                    keystroke "`" using {{command down}}
                 end tell
             end tell
             '''
             try:
-                subprocess.run(['osascript', '-e', applescript], 
+                subprocess.run(['osascript', '-e', applescript],
                              capture_output=True, timeout=3)
             except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
                 # Fallback to showing instructions
                 pass
-        
+
         # For other platforms or if AppleScript fails, we'll show instructions
 
-    def _open_vscode_with_terminal_and_claude(self, path: str, task_id: str) -> None:
-        """Open VS Code with terminal and automatically run Claude CLI with --print option for non-interactive execution"""
+    async def _spawn_vscode_windows(self, worktree_paths: List[Tuple[str, str]]) -> List[Tuple[str, str, bool]]:
+        """Launch 'code -n' for every worktree concurrently, at most 4 at a time.
+
+        'code' forks off and returns almost immediately, so the semaphore
+        only bounds simultaneous fork+exec bursts; each wait keeps the
+        2 s cap of the old serial path. Returns (path, task_id, opened).
+        """
+        sem = asyncio.Semaphore(4)
+
+        async def spawn_one(path: str, task_id: str) -> Tuple[str, str, bool]:
+            async with sem:
+                try:
+                    proc = await asyncio.create_subprocess_exec('code', '-n', path)
+                except (FileNotFoundError, OSError):
+                    return path, task_id, False
+                try:
+                    await asyncio.wait_for(proc.wait(), timeout=2)
+                except asyncio.TimeoutError:
+                    pass
+                return path, task_id, True
+
+        return await asyncio.gather(*(spawn_one(path, task_id)
+                                      for path, task_id in worktree_paths))
+
+    def _run_claude_in_terminal(self, path: str, task_id: str) -> None:
+        """Drive one specific VS Code window: open terminal, run Claude CLI.
+
+        All windows are already open when this runs, so the window for
+        this worktree is raised by title (AXRaise) before any keystroke -
+        activating the app alone would send everything to whichever
+        window happens to be frontmost.
+        """
         prompt_file = f"{self.project_root}/prompts/{task_id}.txt"
         worktree_path = path
-        
-        try:
-            # Open VS Code in new window
-            subprocess.run(['code', '-n', path], check=True)
-            print(f"✅ VS Code opened for task {task_id}")
-            
-            # Wait a moment for VS Code to fully load
-            time.sleep(3)
-            
-            # Use AppleScript to open terminal and run Claude CLI with --print option
-            applescript = f'''
-            tell application "Visual Studio Code"
-                activate
-                delay 2
-                tell application "System Events"
-                    -- Open terminal
-                    keystroke "`" using {{command down}}
-                    delay 1
-                    -- Change to worktree directory and run Claude CLI with --print option in one command
-                    keystroke "cd {worktree_path} && claude --print --dangerously-skip-permissions < {prompt_file}"
-                    delay 0.5
-                    -- Press Enter to execute
-                    keystroke return
-                end tell
+        folder = os.path.basename(os.path.abspath(path))
+
+        # Wait until the window for this worktree is actually up
+        self._wait_for_vscode_window(folder)
+
+        # Use AppleScript to raise the window, open its terminal, and run
+        # Claude CLI with the --print option
+        applescript = f'''
+        tell application "Visual Studio Code"
+            activate
+        end tell
+        tell application "System Events"
+            tell process "Code"
+                perform action "AXRaise" of (first window whose name contains "{folder}")
+                delay 1
+                -- Open terminal (fresh window, so this opens rather than toggles)
+                keystroke "`" using {{command down}}
+                delay 1
+                -- Change to worktree directory and run Claude CLI with --print option in one command
+                keystroke "cd {worktree_path} && claude --print --dangerously-skip-permissions < {prompt_file}"
+                delay 0.5
+                -- Press Enter to execute
+                keystroke return
             end tell
-            '''
-            
+        end tell
+        '''
+
+        try:
             subprocess.run(['osascript', '-e', applescript], check=True)
             print(f"✅ Claude CLI started with --print option for task {task_id}")
-            
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to open VS Code or run Claude CLI for task {task_id}: {e}")
-            print(f"💡 Manual commands:")
-            print(f"   cd {worktree_path}")
-            print(f"   claude --print --dangerously-skip-permissions < {prompt_file}")
         except Exception as e:
-            print(f"❌ Unexpected error for task {task_id}: {e}")
+            print(f"❌ Failed to run Claude CLI for task {task_id}: {e}")
             print(f"💡 Manual commands:")
             print(f"   cd {worktree_path}")
             print(f"   claude --print --dangerously-skip-permissions < {prompt_file}")
 
+    def _open_claude_windows(self, worktree_paths: List[Tuple[str, str]]) -> None:
+        """Open all VS Code windows concurrently, then run Claude in each.
+
+        Window spawning parallelizes cleanly; only the AppleScript
+        keystroke phase stays serial, since keystrokes go to whichever
+        window has focus.
+        """
+        results = asyncio.run(self._spawn_vscode_windows(worktree_paths))
+        for path, task_id, opened in results:
+            print(f"🎯 Processing task {task_id}...")
+            if not opened:
+                print(f"❌ Failed to open VS Code for task {task_id}")
+                print(f"💡 Manual commands:")
+                print(f"   cd {path}")
+                print(f"   claude --print --dangerously-skip-permissions < {self.project_root}/prompts/{task_id}.txt")
+                continue
+            print(f"✅ VS Code opened for task {task_id}")
+            self._run_claude_in_terminal(path, task_id)
+
+    def _add_worktree(self, branch: str, path: str) -> str:
+        """Attempt a worktree add and interpret the failure instead of pre-checking.
+
+        Returns 'created', 'exists' (branch or worktree already present),
+        or 'failed'. Skipping the _branch_exists probe saves a check per
+        task on the common fresh-create path.
+        """
+        result = subprocess.run(['git', 'worktree', 'add', '-b', branch, path, 'HEAD'],
+                                capture_output=True, text=True)
+        if result.returncode == 0:
+            return 'created'
+
+        if 'already exists' in result.stderr:
+            # Branch exists from a previous run - try attaching it instead
+            result = subprocess.run(['git', 'worktree', 'add', path, branch],
+                                    capture_output=True, text=True)
+            if result.returncode == 0:
+                return 'created'
+            if 'already exists' in result.stderr:
+                return 'exists'
+
+        return 'failed'
+
+    def _worktree_exists(self, path: str) -> bool:
+        """Check for an attached worktree with a filesystem probe, not a git call
+
+        'git worktree add' drops a .git file (or dir) at the worktree root,
+        so its presence is enough to take the reuse path without forking git.
+        """
+        return os.path.exists(os.path.join(path, '.git'))
+
+    def _create_worktrees(self, ready_ids: List[str]) -> List[Tuple[str, str]]:
+        """Create worktrees for the given tasks in parallel, returning (path, task_id) pairs"""
+        jobs = []
+        reused = []
+        for task_id in ready_ids:
+            title = self.get_title(task_id)
+            slug = self.slugify(title)
+            branch = f"{self.branch_prefix}{task_id}-{slug}"
+            path = f"{self.worktree_base}/{task_id}-{slug}"
+            if self._worktree_exists(path):
+                print(f"Worktree {path} already exists. Reusing.")
+                reused.append((path, task_id))
+            else:
+                jobs.append((task_id, branch, path))
+
+        if not jobs:
+            return reused
+
+        worktree_paths = reused
+        # Each add targets a distinct branch/path, so they run safely in parallel
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            futures = {
+                executor.submit(self._add_worktree, branch, path): (task_id, branch, path)
+                for task_id, branch, path in jobs
+            }
+            for future in as_completed(futures):
+                task_id, branch, path = futures[future]
+                outcome = future.result()
+                if outcome == 'created':
+                    print(f"Created worktree {path} (branch {branch})")
+                    worktree_paths.append((path, task_id))
+                elif outcome == 'exists':
+                    print(f"Branch {branch} already exists. Skipping.")
+                    worktree_paths.append((path, task_id))
+                else:
+                    print(f"WARNING: Failed to create worktree for task {task_id}. Continuing...")
+
+        return worktree_paths
+
     def worktree_ready(self) -> None:
         """Create git worktrees for all ready tasks"""
         if not self._is_git_repo():
@@ -350,7 +820,7 @@ Instructions:
             print("Need at least one commit for worktrees.")
             sys.exit(1)
         
-        Path(self.worktree_base).mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.worktree_base)
         
         ready_ids = self.jq_ready_ids()
         if not ready_ids:
@@ -367,32 +837,14 @@ Instructions:
             print("\nWorktree creation cancelled.")
             return
         
-        worktree_paths = []
-        for task_id in ready_ids:
-            title = self.get_title(task_id)
-            slug = self.slugify(title)
-            branch = f"{self.branch_prefix}{task_id}-{slug}"
-            path = f"{self.worktree_base}/{task_id}-{slug}"
-            
-            if self._branch_exists(branch):
-                print(f"Branch {branch} already exists. Skipping.")
-                worktree_paths.append(path)
-            else:
-                try:
-                    subprocess.run(['git', 'worktree', 'add', '-b', branch, path, 'HEAD'], 
-                                  check=True)
-                    print(f"Created worktree {path} (branch {branch})")
-                    worktree_paths.append(path)
-                except subprocess.CalledProcessError:
-                    print(f"WARNING: Failed to create worktree for task {task_id}. Continuing...")
-        
+        worktree_paths = [path for path, _ in self._create_worktrees(ready_ids)]
+
         # Open VS Code windows with terminal
         if worktree_paths:
             if self._command_exists('code'):
                 print("Opening worktree directories in separate VS Code windows with terminal...")
                 for path in worktree_paths:
                     self._open_vscode_with_terminal(path)
-                    time.sleep(1)  # Small delay between windows
                 
                 print("\n💡 만약 터미널이 자동으로 열리지 않았다면:")
                 print("  • 키보드 단축키: Ctrl+` (백틱) 또는 Cmd+` (Mac)")
@@ -402,6 +854,34 @@ Instructions:
                 for path in worktree_paths:
                     print(f"  - {path}")
 
+    def _ensure_dir(self, path: str) -> None:
+        """mkdir -p, but at most one stat per directory per process"""
+        if path not in self._dirs_ready:
+            Path(path).mkdir(parents=True, exist_ok=True)
+            self._dirs_ready.add(path)
+
+    def _set_status_batch(self, task_ids: List[str], status: str) -> None:
+        """Set status for multiple tasks with a single task-master invocation"""
+        if not task_ids:
+            return
+        try:
+            subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag,
+                           '--id', ','.join(task_ids), '--status', status], check=True)
+        except subprocess.CalledProcessError:
+            # Older CLIs may reject the comma-separated form - fan the per-ID
+            # calls out as parallel Popen batches so Node startups overlap
+            limit = min(len(task_ids), os.cpu_count() or 4)
+            for start in range(0, len(task_ids), limit):
+                procs = [
+                    (task_id, subprocess.Popen([self.tm_bin, 'set-status', '--tag', self.tag,
+                                                '--id', task_id, '--status', status]))
+                    for task_id in task_ids[start:start + limit]
+                ]
+                for task_id, proc in procs:
+                    if proc.wait() != 0:
+                        print(f"WARNING: Failed to set status for task {task_id}. Continuing...")
+        self._invalidate_tasks_cache()
+
     def start_ready(self) -> None:
         """Set all ready tasks to in-progress status"""
         ready_ids = self.jq_ready_ids()
@@ -420,12 +900,7 @@ Instructions:
             return
         
         print(f"Starting: {' '.join(ready_ids)}")
-        for task_id in ready_ids:
-            try:
-                subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag, 
-                               '--id', task_id, '--status', 'in-progress'], check=True)
-            except subprocess.CalledProcessError:
-                print(f"WARNING: Failed to set status for task {task_id}. Continuing...")
+        self._set_status_batch(ready_ids, 'in-progress')
 
     def kickoff_ready(self) -> None:
         """Complete kickoff: prompts + worktrees + status change"""
@@ -455,50 +930,22 @@ Instructions:
         print(f"Ready IDs: {' '.join(ready_ids)}")
         
         # Generate prompts
-        Path(self.prompt_dir).mkdir(parents=True, exist_ok=True)
-        for task_id in ready_ids:
-            prompt_text = self.prompt_one(task_id)
-            prompt_file = Path(self.prompt_dir) / f"{task_id}.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(prompt_text)
-            print(f"Wrote {prompt_file}")
-        
+        self._ensure_dir(self.prompt_dir)
+        self._write_prompts(ready_ids, self.prompt_dir)
+
         # Create worktrees
-        Path(self.worktree_base).mkdir(parents=True, exist_ok=True)
-        worktree_paths = []
-        for task_id in ready_ids:
-            title = self.get_title(task_id)
-            slug = self.slugify(title)
-            branch = f"{self.branch_prefix}{task_id}-{slug}"
-            path = f"{self.worktree_base}/{task_id}-{slug}"
-            
-            if self._branch_exists(branch):
-                print(f"Branch {branch} already exists. Skipping.")
-                worktree_paths.append(path)
-            else:
-                try:
-                    subprocess.run(['git', 'worktree', 'add', '-b', branch, path, 'HEAD'], 
-                                  check=True)
-                    print(f"Created worktree {path} (branch {branch})")
-                    worktree_paths.append(path)
-                except subprocess.CalledProcessError:
-                    print(f"WARNING: Failed to create worktree for task {task_id}. Continuing...")
-        
+        self._ensure_dir(self.worktree_base)
+        worktree_paths = [path for path, _ in self._create_worktrees(ready_ids)]
+
         # Set status to in-progress
-        for task_id in ready_ids:
-            try:
-                subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag, 
-                               '--id', task_id, '--status', 'in-progress'], check=True)
-            except subprocess.CalledProcessError:
-                print(f"WARNING: Failed to set status for task {task_id}. Continuing...")
-        
+        self._set_status_batch(ready_ids, 'in-progress')
+
         # Open VS Code windows with terminal
         if worktree_paths:
             if self._command_exists('code'):
                 print("Opening worktree directories in separate VS Code windows with terminal...")
                 for path in worktree_paths:
                     self._open_vscode_with_terminal(path)
-                    time.sleep(1)  # Small delay between windows
                 
                 print("\n💡 만약 터미널이 자동으로 열리지 않았다면:")
                 print("  • 키보드 단축키: Ctrl+` (백틱) 또는 Cmd+` (Mac)")
@@ -516,36 +963,31 @@ Instructions:
             task_ids = self.jq_ready_ids()
         
         print(f"== Checking worktrees/branches/status for: {' '.join(task_ids)} ==")
-        
+
+        # One load up front: the per-task body below is pure dict/stat lookups
+        status_map = self._get_status_map(self._get_task_summaries())
+
         for task_id in task_ids:
             title = self.get_title(task_id)
             slug = self.slugify(title)
             branch = f"{self.branch_prefix}{task_id}-{slug}"
             path = f"{self.worktree_base}/{task_id}-{slug}"
-            
+
             # Check directory
             dir_status = "[dir OK]" if Path(path).is_dir() else "[dir MISSING]"
-            
-            # Check branch
+
+            # Check branch (filesystem probe, no fork)
             branch_status = "[branch OK]" if self._branch_exists(branch) else "[branch MISSING]"
-            
+
             # Check task status
-            data = self._load_tasks()
-            all_tasks = self._get_all_tasks(data)
-            task_status = ""
-            for task in all_tasks:
-                if str(task['id']) == task_id:
-                    task_status = task['status']
-                    break
-            
+            task_status = status_map.get(task_id, "")
             status_check = "[status OK]" if task_status == "in-progress" else f"[status {task_status}]"
-            
+
             print(f"Task {task_id}: {dir_status} {branch_status} {status_check}")
 
     def debug_ready(self) -> None:
         """Debug output for ready task logic"""
-        data = self._load_tasks()
-        all_tasks = self._get_all_tasks(data)
+        all_tasks = self._get_task_summaries()
         status_map = self._get_status_map(all_tasks)
         
         for task in all_tasks:
@@ -569,6 +1011,67 @@ Instructions:
     def run_tm_command(self, args: List[str]) -> None:
         """Run task-master command with tag"""
         subprocess.run([self.tm_bin] + args + ['--tag', self.tag])
+        self._invalidate_tasks_cache()
+
+    def serve_daemon(self) -> None:
+        """Answer query commands over a Unix socket, keeping caches warm.
+
+        One line-delimited JSON argv per connection; the reply is a JSON
+        object with the command's captured stdout and exit status. The
+        parsed tasks.json stays cached between requests (mtime-checked),
+        so repeated ready/blocked queries skip interpreter startup,
+        imports, and re-parsing. The socket path is project-scoped (see
+        _daemon_socket_path), so clients in other projects never reach
+        this daemon.
+        """
+        sock_path = _daemon_socket_path()
+        try:
+            os.unlink(sock_path)
+        except FileNotFoundError:
+            pass
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(sock_path)
+        server.listen()
+        print(f"tmh daemon listening on {sock_path}")
+
+        try:
+            while True:
+                conn, _ = server.accept()
+                with conn:
+                    line = conn.makefile('rb').readline()
+                    if not line:
+                        continue
+                    try:
+                        args = json.loads(line)
+                    except ValueError:
+                        continue
+
+                    out = io.StringIO()
+                    status = 0
+                    old_argv = sys.argv
+                    sys.argv = ['tmh.py'] + list(args)
+                    try:
+                        with contextlib.redirect_stdout(out):
+                            self.main()
+                    except SystemExit as e:
+                        if isinstance(e.code, int):
+                            status = e.code
+                        elif e.code is not None:
+                            status = 1
+                    finally:
+                        sys.argv = old_argv
+
+                    conn.sendall(json.dumps(
+                        {'status': status, 'output': out.getvalue()}).encode('utf-8'))
+        except KeyboardInterrupt:
+            print("\ntmh daemon stopped.")
+        finally:
+            server.close()
+            try:
+                os.unlink(sock_path)
+            except FileNotFoundError:
+                pass
 
     def usage(self) -> None:
         """Print usage information"""
@@ -598,6 +1101,7 @@ COMMANDS:
     next                Show next task to work on
     debug-ready         Debug ready task detection
     verify-kickoff [ids] Verify kickoff setup
+    --daemon            Run as a background daemon (fast repeated queries)
     help                Show this help
 
 EXAMPLES:
@@ -626,119 +1130,109 @@ TAG DETECTION:
     Override with: TAG=your-tag ./tmh.py <command>
         """)
 
+    def _cmd_ready_ids(self, args: list) -> None:
+        for task_id in self.jq_ready_ids():
+            print(task_id)
+
+    def _cmd_blocked(self, args: list) -> None:
+        for task_id, deps in self.jq_blocked():
+            print(f"{task_id}\tblocked by: {deps}")
+
+    def _cmd_start_ready(self, args: list) -> None:
+        self.start_ready()
+
+    def _cmd_prompt(self, args: list) -> None:
+        if len(args) != 1:
+            print("Usage: tmh.py prompt <id>")
+            sys.exit(1)
+        print(self.prompt_one(args[0]))
+
+    def _cmd_prompt_all_ready(self, args: list) -> None:
+        self.prompt_all_ready()
+
+    def _cmd_worktree_ready(self, args: list) -> None:
+        self.worktree_ready()
+
+    def _cmd_kickoff_ready(self, args: list) -> None:
+        self.kickoff_ready()
+
+    def _cmd_kickoff_ready_claude(self, args: list) -> None:
+        self.kickoff_ready_with_claude()
+
+    def _cmd_worktree_ready_claude(self, args: list) -> None:
+        self.worktree_ready_with_claude()
+
+    def _cmd_debug_ready(self, args: list) -> None:
+        self.debug_ready()
+
+    def _cmd_verify_kickoff(self, args: list) -> None:
+        self.verify_kickoff(args if args else None)
+
+    def _cmd_set(self, args: list) -> None:
+        if len(args) < 2:
+            print("Usage: tmh.py set <status> <ids...>")
+            sys.exit(1)
+        status = args[0]
+        task_ids = args[1:]
+        self._set_status_batch(task_ids, status)
+
+    def _cmd_show(self, args: list) -> None:
+        if len(args) != 1:
+            print("Usage: tmh.py show <id>")
+            sys.exit(1)
+        self.run_tm_command(['show', args[0]])
+
+    def _cmd_next(self, args: list) -> None:
+        self.run_tm_command(['next'])
+
+    def _cmd_claude_prompt(self, args: list) -> None:
+        if len(args) != 1:
+            print("Usage: tmh.py claude-prompt <task_id>")
+            sys.exit(1)
+        self.claude_prompt(args[0])
+
+    def _cmd_claude_ready(self, args: list) -> None:
+        self.claude_ready()
+
+    def _cmd_generate_scripts(self, args: list) -> None:
+        self.generate_claude_scripts()
+
+    def _cmd_generate_review(self, args: list) -> None:
+        # Check for --include-subtasks flag
+        include_subtasks = '--include-subtasks' in args if args else False
+        if include_subtasks and args:
+            args.remove('--include-subtasks')
+
+        task_ids = args if args else None
+        if task_ids and len(task_ids) == 1 and ',' in task_ids[0]:
+            task_ids = task_ids[0].split(',')
+        self.generate_diff_and_review(task_ids, include_subtasks=include_subtasks)
+
+    def _cmd_auto_review(self, args: list) -> None:
+        # Enable auto-review, then generate review as usual
+        os.environ['TMH_AUTO_REVIEW'] = 'true'
+        self._cmd_generate_review(args)
+
+    def _cmd_help(self, args: list) -> None:
+        self.usage()
+
     def main(self) -> None:
         """Main entry point"""
         if len(sys.argv) < 2:
             self.usage()
             return
-        
+
         cmd = sys.argv[1]
         args = sys.argv[2:]
-        
-        if cmd == 'ready-ids':
-            ready_ids = self.jq_ready_ids()
-            for task_id in ready_ids:
-                print(task_id)
-        
-        elif cmd == 'blocked':
-            blocked = self.jq_blocked()
-            for task_id, deps in blocked:
-                print(f"{task_id}\tblocked by: {deps}")
-        
-        elif cmd == 'start-ready':
-            self.start_ready()
-        
-        elif cmd == 'prompt':
-            if len(args) != 1:
-                print("Usage: tmh.py prompt <id>")
-                sys.exit(1)
-            print(self.prompt_one(args[0]))
-        
-        elif cmd == 'prompt-all-ready':
-            self.prompt_all_ready()
-        
-        elif cmd == 'worktree-ready':
-            self.worktree_ready()
-        
-        elif cmd == 'kickoff-ready':
-            self.kickoff_ready()
-        
-        elif cmd == 'kickoff-ready-claude':
-            self.kickoff_ready_with_claude()
-        
-        elif cmd == 'worktree-ready-claude':
-            self.worktree_ready_with_claude()
-        
-        elif cmd == 'debug-ready':
-            self.debug_ready()
-        
-        elif cmd == 'verify-kickoff':
-            self.verify_kickoff(args if args else None)
-        
-        elif cmd == 'set':
-            if len(args) < 2:
-                print("Usage: tmh.py set <status> <ids...>")
-                sys.exit(1)
-            status = args[0]
-            task_ids = args[1:]
-            for task_id in task_ids:
-                subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag, 
-                               '--id', task_id, '--status', status])
-        
-        elif cmd == 'show':
-            if len(args) != 1:
-                print("Usage: tmh.py show <id>")
-                sys.exit(1)
-            self.run_tm_command(['show', args[0]])
-        
-        elif cmd == 'next':
-            self.run_tm_command(['next'])
-        
-        elif cmd == 'claude-prompt':
-            if len(args) != 1:
-                print("Usage: tmh.py claude-prompt <task_id>")
-                sys.exit(1)
-            self.claude_prompt(args[0])
-        
-        elif cmd == 'claude-ready':
-            self.claude_ready()
-        
-        elif cmd == 'generate-scripts':
-            self.generate_claude_scripts()
-        
-        elif cmd == 'generate-review':
-            # Check for --include-subtasks flag
-            include_subtasks = '--include-subtasks' in args if args else False
-            if include_subtasks and args:
-                args.remove('--include-subtasks')
-            
-            task_ids = args if args else None
-            if task_ids and len(task_ids) == 1 and ',' in task_ids[0]:
-                task_ids = task_ids[0].split(',')
-            self.generate_diff_and_review(task_ids, include_subtasks=include_subtasks)
-        
-        elif cmd == 'auto-review':
-            # Enable auto-review and generate review
-            os.environ['TMH_AUTO_REVIEW'] = 'true'
-            
-            # Check for --include-subtasks flag
-            include_subtasks = '--include-subtasks' in args if args else False
-            if include_subtasks and args:
-                args.remove('--include-subtasks')
-            
-            task_ids = args if args else None
-            if task_ids and len(task_ids) == 1 and ',' in task_ids[0]:
-                task_ids = task_ids[0].split(',')
-            self.generate_diff_and_review(task_ids, include_subtasks=include_subtasks)
-        
-        elif cmd in ['help', '-h', '--help']:
-            self.usage()
-        
-        else:
+
+        # O(1) dispatch instead of a linear if/elif cascade
+        handler = self._commands.get(cmd)
+        if handler is None:
             print(f"Unknown command: {cmd}")
             print()
             self.usage()
             sys.exit(1)
+        handler(args)
 
     def claude_prompt(self, task_id: str) -> None:
         """Call claude CLI with specific task prompt"""
@@ -802,6 +1296,59 @@ TAG DETECTION:
         except KeyboardInterrupt:
             print("\nCancelled.")
 
+    async def _add_worktrees_async(self, jobs: List[Tuple[str, str, str]]) -> List[Tuple[str, str, str, int]]:
+        """Spawn 'git worktree add' for every job concurrently and gather results"""
+        async def add_one(task_id: str, branch: str, path: str) -> Tuple[str, str, str, int]:
+            proc = await asyncio.create_subprocess_exec(
+                'git', 'worktree', 'add', '-b', branch, path, 'HEAD',
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+            await proc.communicate()
+            return task_id, branch, path, proc.returncode
+
+        return await asyncio.gather(*(add_one(*job) for job in jobs))
+
+    def _existing_branches(self) -> frozenset:
+        """List all local branch names with a single git invocation"""
+        try:
+            result = subprocess.run(
+                ['git', 'for-each-ref', '--format=%(refname:short)', 'refs/heads/'],
+                capture_output=True, text=True, check=True)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            return frozenset()
+        return frozenset(result.stdout.splitlines())
+
+    def _create_worktrees_for_claude(self, ready_ids: List[str]) -> List[Tuple[str, str]]:
+        """Create worktrees for the Claude automation flows, returning (path, task_id) pairs"""
+        worktree_paths = []
+        jobs = []
+        existing = self._existing_branches()  # one git call for all N membership tests
+        for task_id in ready_ids:
+            title = self.get_title(task_id)
+            slug = self.slugify(title)
+            branch = f"{self.branch_prefix}{task_id}-{slug}"
+            path = f"{self.worktree_base}/{task_id}-{slug}"
+
+            if self._worktree_exists(path):
+                print(f"♻️  Worktree {path} already exists. Reusing.")
+                worktree_paths.append((path, task_id))
+            elif branch in existing:
+                print(f"⚠️  Branch {branch} already exists. Skipping.")
+                worktree_paths.append((path, task_id))
+            else:
+                jobs.append((task_id, branch, path))
+
+        if jobs:
+            # Independent branches/paths: spawn all adds at once and gather
+            results = asyncio.run(self._add_worktrees_async(jobs))
+            for task_id, branch, path, returncode in results:
+                if returncode == 0:
+                    print(f"📁 Created worktree {path} (branch {branch})")
+                    worktree_paths.append((path, task_id))
+                else:
+                    print(f"❌ WARNING: Failed to create worktree for task {task_id}. Continuing...")
+
+        return worktree_paths
+
     def kickoff_ready_with_claude(self) -> None:
         """Complete kickoff with automatic Claude CLI execution"""
         if not self._is_git_repo():
@@ -843,60 +1390,38 @@ TAG DETECTION:
         print(f"🎯 Ready IDs: {' '.join(ready_ids)}")
         
         # Generate prompts
-        Path(self.prompt_dir).mkdir(parents=True, exist_ok=True)
-        for task_id in ready_ids:
-            prompt_text = self.prompt_one(task_id)
-            prompt_file = Path(self.prompt_dir) / f"{task_id}.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(prompt_text)
-            print(f"📝 Wrote {prompt_file}")
+        self._ensure_dir(self.prompt_dir)
+        self._write_prompts(ready_ids, self.prompt_dir, label='📝 Wrote')
         
         # Create worktrees
-        Path(self.worktree_base).mkdir(parents=True, exist_ok=True)
-        worktree_paths = []
-        for task_id in ready_ids:
-            title = self.get_title(task_id)
-            slug = self.slugify(title)
-            branch = f"{self.branch_prefix}{task_id}-{slug}"
-            path = f"{self.worktree_base}/{task_id}-{slug}"
-            
-            if self._branch_exists(branch):
-                print(f"⚠️  Branch {branch} already exists. Skipping.")
-                worktree_paths.append((path, task_id))
-            else:
-                try:
-                    subprocess.run(['git', 'worktree', 'add', '-b', branch, path, 'HEAD'], 
-                                  check=True)
-                    print(f"📁 Created worktree {path} (branch {branch})")
-                    worktree_paths.append((path, task_id))
-                except subprocess.CalledProcessError:
-                    print(f"❌ WARNING: Failed to create worktree for task {task_id}. Continuing...")
-        
-        # Set status to in-progress
-        for task_id in ready_ids:
-            try:
-                subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag, 
-                               '--id', task_id, '--status', 'in-progress'], check=True)
-            except subprocess.CalledProcessError:
-                print(f"⚠️  WARNING: Failed to set status for task {task_id}. Continuing...")
-        
+        self._ensure_dir(self.worktree_base)
+        worktree_paths = self._create_worktrees_for_claude(ready_ids)
+        
+        # Set status to in-progress in the background so the user-visible
+        # VS Code windows open first; one batched call covers every task
+        # (with the per-ID fallback handled inside _set_status_batch)
+        status_executor = ThreadPoolExecutor(max_workers=1)
+        status_future = status_executor.submit(
+            self._set_status_batch, ready_ids, 'in-progress')
+
         # Open VS Code windows with terminal and Claude CLI
         if worktree_paths:
             print("🖥️  Opening VS Code windows with automatic Claude CLI execution...")
-            for path, task_id in worktree_paths:
-                print(f"🎯 Processing task {task_id}...")
-                self._open_vscode_with_terminal_and_claude(path, task_id)
-                time.sleep(2)  # Delay between windows to avoid conflicts
-            
+            self._open_claude_windows(worktree_paths)
+
             print("\n🎉 FULL AUTOMATION COMPLETE!")
             print("Each VS Code window should now be running Claude CLI automatically.")
             print("\n💡 If automation failed, you can manually run:")
+            main_project_path = os.path.abspath('.')
             for _, task_id in worktree_paths:
-                main_project_path = os.path.abspath('.')
                 print(f"   cat {main_project_path}/prompts/{task_id}.txt | claude --dangerously-skip-permissions --print")
         else:
             print("❌ No worktrees were created successfully.")
 
+        # Collect the background status update (it invalidates the cache)
+        status_future.result()
+        status_executor.shutdown()
+
     def worktree_ready_with_claude(self) -> None:
         """Create worktrees and automatically run Claude CLI"""
         if not self._is_git_repo():
@@ -913,7 +1438,7 @@ TAG DETECTION:
             self.worktree_ready()
             return
         
-        Path(self.worktree_base).mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.worktree_base)
         
         ready_ids = self.jq_ready_ids()
         if not ready_ids:
@@ -931,133 +1456,21 @@ TAG DETECTION:
             return
         
         # Generate prompts first
-        Path(self.prompt_dir).mkdir(parents=True, exist_ok=True)
-        for task_id in ready_ids:
-            prompt_text = self.prompt_one(task_id)
-            prompt_file = Path(self.prompt_dir) / f"{task_id}.txt"
-            with open(prompt_file, 'w', encoding='utf-8') as f:
-                f.write(prompt_text)
-            print(f"📝 Wrote {prompt_file}")
+        self._ensure_dir(self.prompt_dir)
+        self._write_prompts(ready_ids, self.prompt_dir, label='📝 Wrote')
         
-        worktree_paths = []
-        for task_id in ready_ids:
-            title = self.get_title(task_id)
-            slug = self.slugify(title)
-            branch = f"{self.branch_prefix}{task_id}-{slug}"
-            path = f"{self.worktree_base}/{task_id}-{slug}"
-            
-            if self._branch_exists(branch):
-                print(f"⚠️  Branch {branch} already exists. Skipping.")
-                worktree_paths.append((path, task_id))
-            else:
-                try:
-                    subprocess.run(['git', 'worktree', 'add', '-b', branch, path, 'HEAD'], 
-                                  check=True)
-                    print(f"📁 Created worktree {path} (branch {branch})")
-                    worktree_paths.append((path, task_id))
-                except subprocess.CalledProcessError:
-                    print(f"❌ WARNING: Failed to create worktree for task {task_id}. Continuing...")
+        worktree_paths = self._create_worktrees_for_claude(ready_ids)
         
         # Open VS Code windows with Claude CLI automation
         if worktree_paths:
             print("🖥️  Opening VS Code windows with automatic Claude CLI execution...")
-            for path, task_id in worktree_paths:
-                print(f"🎯 Processing task {task_id}...")
-                self._open_vscode_with_terminal_and_claude(path, task_id)
-                time.sleep(2)  # Delay between windows
-            
+            self._open_claude_windows(worktree_paths)
+
             print("\n🎉 AUTOMATION COMPLETE!")
             print("Each VS Code window should now be running Claude CLI automatically.")
         else:
             print("❌ No worktrees were created successfully.")
 
-    def run(self) -> None:
-        """Main command dispatcher"""
-        if len(sys.argv) < 2:
-            self.help()
-            return
-        
-        command = sys.argv[1]
-        args = sys.argv[2:]
-        
-        if command == 'ready-ids':
-            ids = self.jq_ready_ids()
-            for id in ids:
-                print(id)
-                
-        elif command == 'blocked':
-            blocked = self.jq_blocked()
-            for line in blocked:
-                print(line)
-                
-        elif command == 'start-ready':
-            self.start_ready()
-            
-        elif command == 'prompt':
-            if not args:
-                print("Usage: ./tmh.py prompt <task_id>")
-                return
-            prompt = self.prompt_one(args[0])
-            if prompt:
-                print(prompt)
-                
-        elif command == 'prompt-all-ready':
-            self.prompt_all_ready()
-            
-        elif command == 'worktree-ready':
-            self.worktree_ready()
-            
-        elif command == 'kickoff-ready':
-            self.kickoff_ready()
-            
-        elif command == 'kickoff-ready-claude':
-            self.kickoff_ready_with_claude()
-        
-        elif command == 'worktree-ready-claude':
-            self.worktree_ready_with_claude()
-        
-        elif command == 'claude-prompt':
-            if not args:
-                print("Usage: ./tmh.py claude-prompt <task_id>")
-                return
-            self.claude_prompt(args[0])
-            
-        elif command == 'claude-ready':
-            self.claude_ready()
-            
-        elif command == 'set':
-            if len(args) < 2:
-                print("Usage: ./tmh.py set <status> <task_id> [task_id...]")
-                return
-            status = args[0]
-            task_ids = args[1:]
-            for task_id in task_ids:
-                subprocess.run([self.tm_bin, 'set-status', '--tag', self.tag, 
-                               '--id', task_id, '--status', status])
-                
-        elif command == 'show':
-            if not args:
-                print("Usage: ./tmh.py show <task_id>")
-                return
-            subprocess.run([self.tm_bin, 'show', '--tag', self.tag, args[0]])
-            
-        elif command == 'next':
-            subprocess.run([self.tm_bin, 'next', '--tag', self.tag])
-            
-        elif command == 'debug-ready':
-            self.debug_ready()
-            
-        elif command == 'verify-kickoff':
-            task_ids = args if args else self.jq_ready_ids()
-            self.verify_kickoff(task_ids)
-            
-        elif command == 'help':
-            self.help()
-            
-        else:
-            print(f"Unknown command: {command}")
-            self.help() 
-
     def generate_claude_scripts(self) -> None:
         """Generate Claude CLI execution scripts for each worktree"""
         ready_ids = self._get_ready_task_ids()
@@ -1066,9 +1479,12 @@ TAG DETECTION:
             return
             
         print(f"🎯 Generating Claude CLI scripts for tasks: {' '.join(ready_ids)}")
-        
+
+        # Resolve every branch name up front (title + slug once per task)
+        branch_names = {task_id: self._get_branch_name(task_id) for task_id in ready_ids}
+
         for task_id in ready_ids:
-            worktree_path = f"{self.worktree_base}/{self._get_branch_name(task_id)[3:]}"  # Remove 'ws/' prefix
+            worktree_path = f"{self.worktree_base}/{branch_names[task_id][3:]}"  # Remove 'ws/' prefix
             prompt_file = f"../../petlab-parallel/prompts/{task_id}.txt"
             
             # Create script content
@@ -1098,8 +1514,7 @@ echo "✅ Claude CLI execution completed for Task {task_id}"
             # Write script to worktree
             script_path = f"{worktree_path}/run_claude.sh"
             try:
-                with open(script_path, 'w') as f:
-                    f.write(script_content)
+                Path(script_path).write_text(script_content, encoding='utf-8')
                 os.chmod(script_path, 0o755)  # Make executable
                 print(f"📝 Created executable script: {script_path}")
             except Exception as e:
@@ -1124,36 +1539,55 @@ echo "✅ Claude CLI execution completed for Task {task_id}"
             return
             
         print(f"🔍 Generating diffs and requesting Opus review for tasks: {' '.join(task_ids)}")
-        
+
         # Create review directory
         review_dir = "reviews"
-        os.makedirs(review_dir, exist_ok=True)
-        
-        for task_id in task_ids:
+        self._ensure_dir(review_dir)
+
+        # The per-task git diffs are independent - run them concurrently
+        asyncio.run(self._generate_reviews_async(task_ids, review_dir))
+
+    async def _generate_reviews_async(self, task_ids: list, review_dir: str) -> None:
+        """Generate diff + review request for each task concurrently"""
+        print_lock = asyncio.Lock()
+
+        async def review_one(task_id: str) -> None:
             try:
-                worktree_path = f"{self.worktree_base}/{self._get_branch_name(task_id)[3:]}"  # Remove 'ws/' prefix
                 branch_name = self._get_branch_name(task_id)
-                
-                # Generate diff
-                diff_cmd = f"git diff main..{branch_name}"
-                result = subprocess.run(diff_cmd.split(), capture_output=True, text=True, cwd=worktree_path)
-                
-                if result.returncode != 0:
-                    print(f"❌ Failed to generate diff for task {task_id}: {result.stderr}")
-                    continue
-                    
-                diff_content = result.stdout
-                if not diff_content.strip():
-                    print(f"⚠️  No changes found for task {task_id}")
-                    continue
-                
+                worktree_path = f"{self.worktree_base}/{branch_name[3:]}"  # Remove 'ws/' prefix
+
+                # Generate diff: explicit argv, plain uncolored output, and no
+                # external diff tool; stdout stays a byte stream end to end
+                proc = await asyncio.create_subprocess_exec(
+                    'git', '-c', 'diff.external=', 'diff', '--no-color', '--no-ext-diff',
+                    f'main..{branch_name}',
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                    cwd=worktree_path)
+                stderr_task = asyncio.ensure_future(proc.stderr.read())
+
+                # Peek the first chunk so empty diffs never create a file
+                first_chunk = await proc.stdout.read(1 << 20)
+                if not first_chunk.strip():
+                    stderr = await stderr_task
+                    await proc.wait()
+                    async with print_lock:
+                        if proc.returncode != 0:
+                            print(f"❌ Failed to generate diff for task {task_id}: "
+                                  f"{stderr.decode('utf-8', errors='replace')}")
+                        else:
+                            print(f"⚠️  No changes found for task {task_id}")
+                    return
+
                 # Get task details
                 task_details = self._get_task_details(task_id)
                 task_title = task_details.get('title', f'Task {task_id}')
                 task_description = task_details.get('description', 'No description')
-                
-                # Create review request
-                review_request = f"""# Code Review Request - Task {task_id}
+
+                # Stream the diff between the markdown header and footer:
+                # peak memory stays at one chunk instead of the whole diff
+                review_file = f"{review_dir}/task_{task_id}_review.md"
+                with open(review_file, 'wb', buffering=1 << 20) as f:
+                    f.write(f"""# Code Review Request - Task {task_id}
 
 ## Task Information
 - **Title**: {task_title}
@@ -1172,8 +1606,14 @@ Please review the following changes and provide feedback on:
 ## Changes
 
 ```diff
-{diff_content}
-```
+""".encode('utf-8'))
+                    f.write(first_chunk)
+                    while True:
+                        chunk = await proc.stdout.read(1 << 20)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                    f.write(b"""```
 
 ## Questions for Review
 1. Does this implementation align with the task requirements?
@@ -1183,54 +1623,55 @@ Please review the following changes and provide feedback on:
 
 ---
 *Generated by tmh.py - Task Master Helper*
-"""
-                
-                # Save review request
-                review_file = f"{review_dir}/task_{task_id}_review.md"
-                with open(review_file, 'w') as f:
-                    f.write(review_request)
-                
-                print(f"📋 Created review request: {review_file}")
-                
+""")
+
+                stderr = await stderr_task
+                await proc.wait()
+                if proc.returncode != 0:
+                    os.remove(review_file)
+                    async with print_lock:
+                        print(f"❌ Failed to generate diff for task {task_id}: "
+                              f"{stderr.decode('utf-8', errors='replace')}")
+                    return
+
+                async with print_lock:
+                    print(f"📋 Created review request: {review_file}")
+
                 # Optional: Automatically send to Claude/Opus for review
                 if self._should_auto_review():
-                    self._send_to_opus_review(review_request, task_id)
-                    
+                    await asyncio.to_thread(self._send_to_opus_review, review_file, task_id)
+
             except Exception as e:
-                print(f"❌ Failed to process task {task_id}: {e}")
+                async with print_lock:
+                    print(f"❌ Failed to process task {task_id}: {e}")
+
+        await asyncio.gather(*(review_one(task_id) for task_id in task_ids))
 
     def _should_auto_review(self) -> bool:
         """Check if auto-review is enabled"""
         return os.environ.get('TMH_AUTO_REVIEW', 'false').lower() == 'true'
 
-    def _send_to_opus_review(self, review_request: str, task_id: str) -> None:
+    def _send_to_opus_review(self, review_file: str, task_id: str) -> None:
         """Send review request to Opus via Claude CLI"""
         try:
             print(f"🤖 Sending task {task_id} to Opus for review...")
-            
-            # Create a temporary file for the review request
-            temp_file = f"temp_review_{task_id}.md"
-            with open(temp_file, 'w') as f:
-                f.write(review_request)
-            
-            # Send to Claude CLI for review
-            review_cmd = f"claude --dangerously-skip-permissions {temp_file}"
-            result = subprocess.run(review_cmd.split(), capture_output=True, text=True)
-            
+
+            # The review request is already on disk - hand its path to Claude
+            result = subprocess.run(
+                ['claude', '--dangerously-skip-permissions', review_file],
+                capture_output=True, text=True)
+
             if result.returncode == 0:
-                # Save Opus response
+                # Save Opus response: one buffered write, explicit UTF-8
                 response_file = f"reviews/task_{task_id}_opus_review.md"
-                with open(response_file, 'w') as f:
-                    f.write(f"# Opus Review for Task {task_id}\n\n")
-                    f.write(result.stdout)
-                
+                Path(response_file).write_text(
+                    f"# Opus Review for Task {task_id}\n\n{result.stdout}",
+                    encoding='utf-8')
+
                 print(f"✅ Opus review saved: {response_file}")
             else:
                 print(f"❌ Failed to get Opus review: {result.stderr}")
-            
-            # Clean up temp file
-            os.remove(temp_file)
-            
+
         except Exception as e:
             print(f"❌ Error sending to Opus: {e}")
 
@@ -1245,23 +1686,25 @@ Please review the following changes and provide feedback on:
             else:
                 tag_tasks = tasks_data.get(self.tag, {}).get('tasks', [])
             
+            # Build the ID index once: dependency checks become dict hits
+            by_id = {str(task.get('id')): task for task in tag_tasks}
+
             ready_ids = []
             for task in tag_tasks:
                 # Skip if not pending
                 if task.get('status') != 'pending':
                     continue
-                
+
                 # Skip subtasks unless explicitly included
                 if not include_subtasks and 'parentTaskId' in task:
                     continue
-                
+
                 # Check if all dependencies are completed
                 dependencies = task.get('dependencies', [])
                 all_deps_done = True
-                
+
                 for dep_id in dependencies:
-                    dep_task = self._find_task_by_id(str(dep_id), tag_tasks)
-                    if not dep_task or dep_task.get('status') != 'done':
+                    if by_id.get(str(dep_id), {}).get('status') != 'done':
                         all_deps_done = False
                         break
                 
@@ -1269,15 +1712,18 @@ Please review the following changes and provide feedback on:
                 if all_deps_done:
                     ready_ids.append(str(task.get('id')))
             
-            # Remove duplicates and return
-            return list(set(ready_ids))
+            # Deduplicate while preserving file order (IDs should already be
+            # unique per tag; dict.fromkeys keeps the output deterministic)
+            return list(dict.fromkeys(ready_ids))
             
         except Exception as e:
             print(f"Error getting ready tasks: {e}")
             return []
 
-    def _find_task_by_id(self, task_id: str, tasks: list) -> dict:
-        """Find a task by ID in a list of tasks"""
+    def _find_task_by_id(self, task_id: str, tasks: list, index: Optional[dict] = None) -> dict:
+        """Find a task by ID (dict hit when a pre-built index is supplied)"""
+        if index is not None:
+            return index.get(task_id, {})
         for task in tasks:
             if str(task.get('id')) == task_id:
                 return task
@@ -1300,8 +1746,13 @@ Please review the following changes and provide feedback on:
                     return task
         return {}
 
+    @functools.lru_cache(maxsize=None)
     def _get_branch_name(self, task_id: str) -> str:
-        """Generate a branch name for a given task ID (supports subtasks with dots)"""
+        """Generate a branch name for a given task ID (supports subtasks with dots)
+
+        Memoized: the kickoff flows resolve the same branch name in the
+        worktree, prompt, and status loops.
+        """
         title = self.get_title(task_id)
         slug = self.slugify(title)
         # Convert dots to dashes for subtask IDs (e.g., 3.1 -> 3-1)
@@ -1310,5 +1761,8 @@ Please review the following changes and provide feedback on:
 
 
 if __name__ == '__main__':
-    tmh = TMH()
-    tmh.main() 
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == '--daemon':
+        TMH().serve_daemon()
+    elif not _try_daemon(sys.argv[1:]):
+        tmh = TMH()
+        tmh.main()
\ No newline at end of file
@@ -0,0 +1,74 @@
+# cython: language_level=3
+"""
+tmh_core.pyx - Optional Cython build of tmh's hot task-graph loops
+
+Build with: python setup.py build_ext --inplace
+tmh.py falls back to the pure-Python implementations when this
+extension is not compiled, so it stays strictly optional.
+"""
+
+
+cpdef dict _status_map(list all_tasks):
+    """Create a mapping of task ID to status"""
+    cdef dict status_map = {}
+    cdef dict task
+    for task in all_tasks:
+        status_map[str(task['id'])] = task['status']
+    return status_map
+
+
+cpdef list _ready_ids_from(list all_tasks, dict status_map):
+    """Collect IDs of pending tasks whose dependencies are all satisfied"""
+    cdef list ready_ids = []
+    cdef dict task
+    cdef list dependencies
+    cdef bint deps_satisfied
+    cdef str dep_status
+
+    for task in all_tasks:
+        if task['status'] != 'pending':
+            continue
+
+        dependencies = task.get('dependencies') or []
+        if not dependencies:
+            ready_ids.append(str(task['id']))
+            continue
+
+        deps_satisfied = True
+        for dep_id in dependencies:
+            dep_status = status_map.get(str(dep_id), '')
+            if dep_status != 'done' and dep_status != 'in-progress':
+                deps_satisfied = False
+                break
+
+        if deps_satisfied:
+            ready_ids.append(str(task['id']))
+
+    return ready_ids
+
+
+cpdef list _blocked_from(list all_tasks, dict status_map):
+    """Collect (id, blocking-deps) pairs for pending tasks with unmet dependencies"""
+    cdef list blocked = []
+    cdef dict task
+    cdef list dependencies, unsatisfied_deps
+    cdef str dep_status
+
+    for task in all_tasks:
+        if task['status'] != 'pending':
+            continue
+
+        dependencies = task.get('dependencies') or []
+        if not dependencies:
+            continue
+
+        unsatisfied_deps = []
+        for dep_id in dependencies:
+            dep_status = status_map.get(str(dep_id), '')
+            if dep_status != 'done' and dep_status != 'in-progress':
+                unsatisfied_deps.append(str(dep_id))
+
+        if unsatisfied_deps:
+            blocked.append((str(task['id']), ','.join(unsatisfied_deps)))
+
+    return blocked